@@ -4,11 +4,22 @@
 # Topics: Dictionaries, Loops, Data Manipulation, Conditional Logic
 # ============================================================================
 
+from bisect import bisect_right
+import heapq
 import random
+from collections import Counter, defaultdict
+from operator import itemgetter
 
-print("=" * 70)
+# Precomputed separators and bar strings (index = bar length)
+SEP70 = "=" * 70
+DASH55 = "-" * 55
+DASH60 = "-" * 60
+DASH100 = "-" * 100
+BARS = tuple("█" * i for i in range(51))
+
+print(SEP70)
 print("🏷️  AZURE TAG COMPLIANCE AUDITOR")
-print("=" * 70)
+print(SEP70)
 
 # ============================================================================
 # DEFINE TAGGING POLICY
@@ -27,6 +38,35 @@ VALID_VALUES = {
     "BackupPolicy": ["Daily", "Weekly", "Monthly", "None"]
 }
 
+# Keep the ordered lists for printing, use frozensets for O(1) lookups
+VALID_VALUES_LIST = VALID_VALUES
+VALID_VALUES = {tag: frozenset(values) for tag, values in VALID_VALUES_LIST.items()}
+REQUIRED_TAGS_SET = frozenset(REQUIRED_TAGS)
+RECOMMENDED_TAGS_SET = frozenset(RECOMMENDED_TAGS)
+
+# Suggested default values for auto-remediation
+REMEDIATION_DEFAULTS = {
+    "Environment": "Development",  # Safe default
+    "CostCenter": "UNASSIGNED",
+    "Owner": "ops-team@company.com",
+    "Project": "UNTAGGED"
+}
+
+# Status ladders: STATUS[bisect_right(THRESHOLDS, value)]
+# (a value equal to a threshold gets the higher status)
+SCORE_THRESHOLDS = (60, 75, 90)
+SCORE_STATUS = ("🔴 POOR - Immediate action required", "🟠 NEEDS IMPROVEMENT", "🟡 GOOD", "🟢 EXCELLENT")
+RECOMMENDED_THRESHOLDS = (50, 80)
+RECOMMENDED_STATUS = ("🔴", "🟡", "✅")
+TYPE_THRESHOLDS = (70, 90)
+TYPE_STATUS = ("🔴", "🟡", "✅")
+REQUIRED_COVERAGE_THRESHOLDS = (80, 95)
+REQUIRED_COVERAGE_STATUS = ("🔴 CRITICAL", "🟡 WARNING", "✅ OK")
+OPTIONAL_COVERAGE_THRESHOLDS = (80,)
+OPTIONAL_COVERAGE_STATUS = ("🟡 LOW", "✅ GOOD")
+REPORT_THRESHOLDS = (70, 100)
+REPORT_STATUS = ("🔴 NON-COMPLIANT", "🟡 PARTIAL", "✅ COMPLIANT")
+
 print("\n📋 Tagging Policy:")
 print(f"  Required Tags: {', '.join(REQUIRED_TAGS)}")
 print(f"  Recommended Tags: {', '.join(RECOMMENDED_TAGS)}")
@@ -47,174 +87,210 @@ possible_tags = {
     "MaintenanceWindow": ["Weekend", "Weekday-Night", "Anytime", ""]
 }
 
+NUM_RESOURCES = 50
+
+# Draw each field for all resources in one batch call
+types = random.choices(resource_types, k=NUM_RESOURCES)
+groups = random.choices(["production", "development", "shared"], k=NUM_RESOURCES)
+locations = random.choices(["East US", "West Europe", "Southeast Asia"], k=NUM_RESOURCES)
+
+# Generate random tags (some missing, some incorrect)
+tag_columns = {}
+for tag_name, tag_values in possible_tags.items():
+    # 70% chance of having each tag
+    present = random.choices([True, False], weights=[0.7, 0.3], k=NUM_RESOURCES)
+    values = random.choices(tag_values, k=NUM_RESOURCES)
+    tag_columns[tag_name] = [value if keep else "" for keep, value in zip(present, values)]
+
+# Sometimes add invalid tags
+has_department = random.choices([True, False], weights=[0.1, 0.9], k=NUM_RESOURCES)
+departments = random.choices(["Engineering", "Finance", "HR"], k=NUM_RESOURCES)
+
 resources = []
 
-for i in range(50):
-    resource_type = random.choice(resource_types)
-    
-    # Generate random tags (some missing, some incorrect)
-    tags = {}
-    
-    for tag_name, tag_values in possible_tags.items():
-        # 70% chance of having each tag
-        if random.random() < 0.7:
-            value = random.choice(tag_values)
-            if value:  # Not empty
-                tags[tag_name] = value
-    
-    # Sometimes add invalid tags
-    if random.random() < 0.1:
-        tags["Department"] = random.choice(["Engineering", "Finance", "HR"])
+for i, resource_type in enumerate(types):
+    # Empty values count as missing tags
+    tags = {tag_name: column[i] for tag_name, column in tag_columns.items() if column[i]}
+    if has_department[i]:
+        tags["Department"] = departments[i]
     
     resource = {
         "name": f"{resource_type.lower().replace(' ', '-')}-{i+1:03d}",
         "type": resource_type,
-        "resource_group": f"rg-{random.choice(['production', 'development', 'shared'])}",
-        "location": random.choice(["East US", "West Europe", "Southeast Asia"]),
-        "tags": tags
+        "resource_group": f"rg-{groups[i]}",
+        "location": locations[i],
+        "tags": tags,
+        "_tag_keys": frozenset(tags)  # Tag names, precomputed for set operations
     }
     
     resources.append(resource)
 
-print(f"\n✅ Auditing {len(resources)} Azure resources")
+total_resources = len(resources)
+
+print(f"\n✅ Auditing {total_resources} Azure resources")
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Resources are dicts (unhashable), so results are cached by id(resource).
+# Tags are never changed after generation, so the caches never go stale.
+_required_cache = {}
+_score_cache = {}
+
 def check_required_tags(resource):
     """Check if resource has all required tags"""
-    missing_tags = []
-    for tag in REQUIRED_TAGS:
-        if tag not in resource["tags"]:
-            missing_tags.append(tag)
-    return missing_tags
+    if (key := id(resource)) in _required_cache:
+        return _required_cache[key]
+    missing_tags = REQUIRED_TAGS_SET - resource["_tag_keys"]
+    # Report missing tags in policy order
+    result = tuple(tag for tag in REQUIRED_TAGS if tag in missing_tags) if missing_tags else ()
+    _required_cache[key] = result
+    return result
 
 def check_recommended_tags(resource):
     """Check if resource has recommended tags"""
-    missing_recommended = []
-    for tag in RECOMMENDED_TAGS:
-        if tag not in resource["tags"]:
-            missing_recommended.append(tag)
-    return missing_recommended
+    missing_recommended = RECOMMENDED_TAGS_SET - resource["_tag_keys"]
+    if not missing_recommended:
+        return []
+    return [tag for tag in RECOMMENDED_TAGS if tag in missing_recommended]
 
 def validate_tag_values(resource):
     """Check if tag values are valid"""
+    tags = resource["tags"]
     invalid_tags = []
-    for tag_name, tag_value in resource["tags"].items():
-        if tag_name in VALID_VALUES:
-            if tag_value not in VALID_VALUES[tag_name]:
-                invalid_tags.append({
-                    "tag": tag_name,
-                    "value": tag_value,
-                    "valid_values": VALID_VALUES[tag_name]
-                })
+    # Walk the value policy in order; skip tags the resource lacks
+    for tag_name, valid_values in VALID_VALUES.items():
+        tag_value = tags.get(tag_name)
+        if tag_value is not None and tag_value not in valid_values:
+            invalid_tags.append({
+                "tag": tag_name,
+                "value": tag_value,
+                "valid_values": VALID_VALUES_LIST[tag_name]
+            })
     return invalid_tags
 
-def calculate_compliance_score(resource):
-    """Calculate compliance score (0-100)"""
+def _score_from(missing_required, missing_recommended, invalid_tags):
+    """Compliance score (0-100) from already-computed check results"""
     score = 100
     
     # Required tags (50% of score)
-    missing_required = check_required_tags(resource)
     score -= (len(missing_required) / len(REQUIRED_TAGS)) * 50
     
     # Recommended tags (30% of score)
-    missing_recommended = check_recommended_tags(resource)
     score -= (len(missing_recommended) / len(RECOMMENDED_TAGS)) * 30
     
     # Valid values (20% of score)
-    invalid_tags = validate_tag_values(resource)
     score -= len(invalid_tags) * 10
     
     return max(0, score)
 
+def calculate_compliance_score(resource):
+    """Calculate compliance score (0-100)"""
+    if (key := id(resource)) in _score_cache:
+        return _score_cache[key]
+    score = _score_cache[key] = _score_from(check_required_tags(resource),
+                                            check_recommended_tags(resource),
+                                            validate_tag_values(resource))
+    return score
+
 # ============================================================================
-# ANALYSIS 1: Overall Compliance
+# SINGLE-PASS AUDIT
+# Every check runs once per resource; the analyses below only print results
 # ============================================================================
-print("\n" + "=" * 70)
-print("📊 OVERALL COMPLIANCE SUMMARY")
-print("=" * 70)
 
 compliant_resources = []
 non_compliant_resources = []
+resources_with_invalid_tags = []
+missing_tag_counts = Counter()
+recommended_tag_counts = Counter()
+by_type = defaultdict(list)
+by_type_compliant = defaultdict(int)
+tag_coverage = Counter()
+total_score = 0
+scored = []  # (score, missing required count, resource)
 
 for resource in resources:
     missing_required = check_required_tags(resource)
-    if len(missing_required) == 0:
+    missing_rec = check_recommended_tags(resource)
+    invalid_tags = validate_tag_values(resource)
+    score = _score_cache[id(resource)] = _score_from(missing_required, missing_rec, invalid_tags)
+    resource_type = resource["type"]
+    
+    by_type[resource_type].append(resource)
+    if not missing_required:
         compliant_resources.append(resource)
+        by_type_compliant[resource_type] += 1
     else:
         non_compliant_resources.append(resource)
+    
+    missing_tag_counts.update(missing_required)
+    recommended_tag_counts.update(missing_rec)
+    
+    if invalid_tags:
+        resources_with_invalid_tags.append({
+            "resource": resource,
+            "invalid_tags": invalid_tags
+        })
+    
+    tag_coverage.update(resource["_tag_keys"])
+    total_score += score
+    scored.append((score, len(missing_required), resource))
+
+# ============================================================================
+# ANALYSIS 1: Overall Compliance
+# ============================================================================
+print("\n" + SEP70)
+print("📊 OVERALL COMPLIANCE SUMMARY")
+print(SEP70)
 
-compliance_rate = (len(compliant_resources) / len(resources)) * 100
+compliance_rate = (len(compliant_resources) / total_resources) * 100
 
 print(f"\n✅ Fully Compliant: {len(compliant_resources)} resources ({compliance_rate:.1f}%)")
 print(f"❌ Non-Compliant: {len(non_compliant_resources)} resources ({100-compliance_rate:.1f}%)")
 
 # Calculate average compliance score
-avg_score = sum([calculate_compliance_score(r) for r in resources]) / len(resources)
+avg_score = total_score / total_resources
 
 print(f"\n📈 Average Compliance Score: {avg_score:.1f}/100")
 
-if avg_score >= 90:
-    print("   Status: 🟢 EXCELLENT")
-elif avg_score >= 75:
-    print("   Status: 🟡 GOOD")
-elif avg_score >= 60:
-    print("   Status: 🟠 NEEDS IMPROVEMENT")
-else:
-    print("   Status: 🔴 POOR - Immediate action required")
+print(f"   Status: {SCORE_STATUS[bisect_right(SCORE_THRESHOLDS, avg_score)]}")
 
 # ============================================================================
 # ANALYSIS 2: Missing Required Tags
 # ============================================================================
-print("\n" + "=" * 70)
+print("\n" + SEP70)
 print("🔴 MISSING REQUIRED TAGS")
-print("=" * 70)
-
-# Count missing tags across all resources
-missing_tag_counts = {tag: 0 for tag in REQUIRED_TAGS}
-
-for resource in resources:
-    missing = check_required_tags(resource)
-    for tag in missing:
-        missing_tag_counts[tag] += 1
+print(SEP70)
 
 print("\n📊 Missing Tag Statistics:")
-for tag, count in sorted(missing_tag_counts.items(), key=lambda x: x[1], reverse=True):
-    pct = (count / len(resources)) * 100
-    bar = "█" * int(pct / 2)
-    print(f"  {tag:20s}: {count:3d} resources ({pct:5.1f}%) {bar}")
+# Counters only hold tags seen at least once, so walk the policy list
+stat_lines = []
+for tag in sorted(REQUIRED_TAGS, key=lambda t: missing_tag_counts.get(t, 0), reverse=True):
+    count = missing_tag_counts.get(tag, 0)
+    pct = (count / total_resources) * 100
+    bar = BARS[min(50, int(pct / 2))]
+    stat_lines.append(f"  {tag:20s}: {count:3d} resources ({pct:5.1f}%) {bar}")
+print("\n".join(stat_lines))
 
 # Show resources with most missing tags
 print("\n⚠️  Resources with Most Missing Tags:")
-resources_by_missing = sorted(resources, 
-                              key=lambda r: len(check_required_tags(r)), 
-                              reverse=True)[:10]
+# Only non-compliant rows can make the list, so keep the heap to those
+resources_by_missing = heapq.nlargest(10, (row for row in scored if row[1]),
+                                     key=itemgetter(1))
 
-for resource in resources_by_missing:
+for _, _, resource in resources_by_missing:
     missing = check_required_tags(resource)
-    if missing:
-        print(f"\n  🔴 {resource['name']}")
-        print(f"     Type: {resource['type']}")
-        print(f"     Missing: {', '.join(missing)}")
+    print(f"\n  🔴 {resource['name']}")
+    print(f"     Type: {resource['type']}")
+    print(f"     Missing: {', '.join(missing)}")
 
 # ============================================================================
 # ANALYSIS 3: Invalid Tag Values
 # ============================================================================
-print("\n" + "=" * 70)
+print("\n" + SEP70)
 print("⚠️  INVALID TAG VALUES")
-print("=" * 70)
-
-resources_with_invalid_tags = []
-
-for resource in resources:
-    invalid_tags = validate_tag_values(resource)
-    if invalid_tags:
-        resources_with_invalid_tags.append({
-            "resource": resource,
-            "invalid_tags": invalid_tags
-        })
+print(SEP70)
 
 if resources_with_invalid_tags:
     print(f"\n⚠️  {len(resources_with_invalid_tags)} resource(s) with invalid tag values:\n")
@@ -233,157 +309,135 @@ else:
 # ============================================================================
 # ANALYSIS 4: Missing Recommended Tags
 # ============================================================================
-print("=" * 70)
+print(SEP70)
 print("💡 RECOMMENDED TAGS ANALYSIS")
-print("=" * 70)
-
-# Count missing recommended tags
-recommended_tag_counts = {tag: 0 for tag in RECOMMENDED_TAGS}
-
-for resource in resources:
-    missing_rec = check_recommended_tags(resource)
-    for tag in missing_rec:
-        recommended_tag_counts[tag] += 1
+print(SEP70)
 
 print("\n📊 Recommended Tag Coverage:")
 for tag in RECOMMENDED_TAGS:
-    missing_count = recommended_tag_counts[tag]
-    present_count = len(resources) - missing_count
-    coverage_pct = (present_count / len(resources)) * 100
+    missing_count = recommended_tag_counts.get(tag, 0)
+    present_count = total_resources - missing_count
+    coverage_pct = (present_count / total_resources) * 100
     
-    status = "✅" if coverage_pct >= 80 else "🟡" if coverage_pct >= 50 else "🔴"
+    status = RECOMMENDED_STATUS[bisect_right(RECOMMENDED_THRESHOLDS, coverage_pct)]
     
-    print(f"  {status} {tag:25s}: {present_count:3d}/{len(resources)} resources ({coverage_pct:5.1f}%)")
+    print(f"  {status} {tag:25s}: {present_count:3d}/{total_resources} resources ({coverage_pct:5.1f}%)")
 
 # ============================================================================
 # ANALYSIS 5: Compliance by Resource Type
 # ============================================================================
-print("\n" + "=" * 70)
+print("\n" + SEP70)
 print("📊 COMPLIANCE BY RESOURCE TYPE")
-print("=" * 70)
+print(SEP70)
 
 compliance_by_type = {}
 
 for resource_type in resource_types:
-    type_resources = [r for r in resources if r["type"] == resource_type]
-    if type_resources:
-        type_compliant = [r for r in type_resources if len(check_required_tags(r)) == 0]
-        compliance_pct = (len(type_compliant) / len(type_resources)) * 100
+    if resource_type in by_type:
+        total = len(by_type[resource_type])
+        compliant = by_type_compliant[resource_type]
+        compliance_pct = (compliant / total) * 100
         
         compliance_by_type[resource_type] = {
-            "total": len(type_resources),
-            "compliant": len(type_compliant),
+            "total": total,
+            "compliant": compliant,
             "compliance_pct": compliance_pct
         }
 
 print(f"\n{'Resource Type':<25} {'Total':<8} {'Compliant':<12} {'Rate':<10}")
-print("-" * 60)
+print(DASH60)
 
 for resource_type in sorted(compliance_by_type.keys(), 
                             key=lambda x: compliance_by_type[x]["compliance_pct"]):
     stats = compliance_by_type[resource_type]
-    status = "✅" if stats["compliance_pct"] >= 90 else "🟡" if stats["compliance_pct"] >= 70 else "🔴"
+    status = TYPE_STATUS[bisect_right(TYPE_THRESHOLDS, stats["compliance_pct"])]
     print(f"{resource_type:<25} {stats['total']:<8} {stats['compliant']:<12} {status} {stats['compliance_pct']:>5.1f}%")
 
 # ============================================================================
 # ANALYSIS 6: Tag Coverage Matrix
 # ============================================================================
-print("\n" + "=" * 70)
+print("\n" + SEP70)
 print("📋 TAG COVERAGE MATRIX")
-print("=" * 70)
+print(SEP70)
 
 all_tags = REQUIRED_TAGS + RECOMMENDED_TAGS
 
-# Count resources with each tag
-tag_coverage = {}
-for tag in all_tags:
-    count = sum(1 for r in resources if tag in r["tags"])
-    tag_coverage[tag] = count
-
 print(f"\n{'Tag Name':<25} {'Coverage':<15} {'Status':<10}")
-print("-" * 55)
+print(DASH55)
 
+coverage_lines = []
 for tag in all_tags:
     count = tag_coverage[tag]
-    coverage_pct = (count / len(resources)) * 100
+    coverage_pct = (count / total_resources) * 100
     is_required = tag in REQUIRED_TAGS
     
     if is_required:
-        status = "✅ OK" if coverage_pct >= 95 else "🔴 CRITICAL" if coverage_pct < 80 else "🟡 WARNING"
+        status = REQUIRED_COVERAGE_STATUS[bisect_right(REQUIRED_COVERAGE_THRESHOLDS, coverage_pct)]
         tag_label = f"{tag} [REQUIRED]"
     else:
-        status = "✅ GOOD" if coverage_pct >= 80 else "🟡 LOW"
+        status = OPTIONAL_COVERAGE_STATUS[bisect_right(OPTIONAL_COVERAGE_THRESHOLDS, coverage_pct)]
         tag_label = f"{tag} [OPTIONAL]"
     
-    print(f"{tag_label:<25} {count}/{len(resources)} ({coverage_pct:>5.1f}%) {status}")
+    coverage_lines.append(f"{tag_label:<25} {count}/{total_resources} ({coverage_pct:>5.1f}%) {status}")
+print("\n".join(coverage_lines))
 
 # ============================================================================
 # GENERATE AUTO-REMEDIATION SCRIPT
 # ============================================================================
-print("\n" + "=" * 70)
+print("\n" + SEP70)
 print("🔧 AUTO-REMEDIATION SUGGESTIONS")
-print("=" * 70)
+print(SEP70)
 
 remediation_commands = []
+remediation_lines = []
 
 for resource in non_compliant_resources[:5]:  # Show first 5
     missing_tags = check_required_tags(resource)
     
     if missing_tags:
-        print(f"\n📝 {resource['name']}:")
-        print(f"   # Azure CLI commands to fix missing tags:")
+        remediation_lines.append(f"\n📝 {resource['name']}:")
+        remediation_lines.append("   # Azure CLI commands to fix missing tags:")
         
         for tag in missing_tags:
-            # Suggest default values
-            default_value = ""
-            if tag == "Environment":
-                default_value = "Development"  # Safe default
-            elif tag == "CostCenter":
-                default_value = "UNASSIGNED"
-            elif tag == "Owner":
-                default_value = "ops-team@company.com"
-            elif tag == "Project":
-                default_value = "UNTAGGED"
-            
+            default_value = REMEDIATION_DEFAULTS.get(tag, "")
             cmd = f"   az resource tag --tags {tag}='{default_value}' --ids {resource['name']}"
-            print(cmd)
+            remediation_lines.append(cmd)
             remediation_commands.append(cmd)
 
+if remediation_lines:
+    print("\n".join(remediation_lines))
+
 if len(non_compliant_resources) > 5:
     print(f"\n   ... and {len(non_compliant_resources) - 5} more resources need attention")
 
 # ============================================================================
 # COMPLIANCE REPORT BY RESOURCE
 # ============================================================================
-print("\n" + "=" * 70)
+print("\n" + SEP70)
 print("📋 DETAILED COMPLIANCE REPORT")
-print("=" * 70)
+print(SEP70)
 
 print(f"\n{'Resource Name':<30} {'Type':<20} {'Score':<8} {'Status':<12} {'Issues'}")
-print("-" * 100)
+print(DASH100)
+
+scored.sort(key=itemgetter(0))
 
-for resource in sorted(resources, key=lambda r: calculate_compliance_score(r)):
-    score = calculate_compliance_score(resource)
+report_lines = []
+for score, _, resource in scored:
     missing = check_required_tags(resource)
     
-    if score == 100:
-        status = "✅ COMPLIANT"
-        issues = "None"
-    elif score >= 70:
-        status = "🟡 PARTIAL"
-        issues = f"{len(missing)} missing tags"
-    else:
-        status = "🔴 NON-COMPLIANT"
-        issues = f"{len(missing)} missing tags"
+    status = REPORT_STATUS[bisect_right(REPORT_THRESHOLDS, score)]
+    issues = "None" if score == 100 else f"{len(missing)} missing tags"
     
-    print(f"{resource['name']:<30} {resource['type']:<20} {score:>5.0f}/100  {status:<12} {issues}")
+    report_lines.append(f"{resource['name']:<30} {resource['type']:<20} {score:>5.0f}/100  {status:<12} {issues}")
+print("\n".join(report_lines))
 
 # ============================================================================
 # FINAL RECOMMENDATIONS
 # ============================================================================
-print("\n" + "=" * 70)
+print("\n" + SEP70)
 print("💡 RECOMMENDATIONS & ACTION PLAN")
-print("=" * 70)
+print(SEP70)
 
 print("\n🎯 Priority Actions:")
 
@@ -403,8 +457,8 @@ if resources_with_invalid_tags:
     action_count += 1
 
 # Action 3: Add recommended tags
-low_coverage_tags = [tag for tag, count in recommended_tag_counts.items() 
-                     if (count / len(resources)) > 0.5]
+low_coverage_tags = [tag for tag in RECOMMENDED_TAGS
+                     if (recommended_tag_counts.get(tag, 0) / total_resources) > 0.5]
 if low_coverage_tags:
     print(f"\n{action_count}. [MEDIUM] Improve coverage for recommended tags: {', '.join(low_coverage_tags[:3])}")
     print(f"   Impact: Enhanced resource management and automation")
@@ -414,22 +468,22 @@ if low_coverage_tags:
 print(f"\n{action_count}. [MEDIUM] Implement Azure Policy to enforce tagging")
 print(f"   Impact: Prevent future non-compliance")
 
-print("\n" + "=" * 70)
+print("\n" + SEP70)
 print("📊 SUMMARY")
-print("=" * 70)
+print(SEP70)
 
 print(f"""
-Total Resources Audited: {len(resources)}
+Total Resources Audited: {total_resources}
 Fully Compliant: {len(compliant_resources)}
 Non-Compliant: {len(non_compliant_resources)}
 Average Compliance Score: {avg_score:.1f}/100
 
-Most Missing Tag: {max(missing_tag_counts, key=missing_tag_counts.get)}
-Resources Needing Attention: {len([r for r in resources if calculate_compliance_score(r) < 70])}
+Most Missing Tag: {max(REQUIRED_TAGS, key=lambda t: missing_tag_counts.get(t, 0))}
+Resources Needing Attention: {sum(1 for score, _, _ in scored if score < 70)}
 
 💡 Tip: Run 'az policy definition create' to enforce tagging policy
 """)
 
-print("=" * 70)
+print(SEP70)
 print("✅ Tag compliance audit complete!")
-print("=" * 70)
\ No newline at end of file
+print(SEP70)
\ No newline at end of file
@@ -8,30 +8,82 @@
 # ============================================================================
 from datetime import datetime
 from abc import ABC, abstractmethod
+from types import MappingProxyType
+import io
+import os
 import random
+import sys
+import numpy as np
+import pandas as pd
+
+# Charts are opt-in (PLOT=1) so batch runs skip matplotlib entirely
+PLOT = os.environ.get("PLOT", "").lower() in ("1", "true", "yes")
+if PLOT:
+    import matplotlib
+    matplotlib.use('Agg')  # Off-screen rendering, no GUI backend start-up
+    import matplotlib.pyplot as plt
 
 print("=" * 70)
 print("🏗️  AZURE RESOURCE MANAGER - OOP LAB")
 print("=" * 70)
 
+# Interned tag strings - resources store (key_id, value_id) _TAG_DTYPE pairs
+# instead of a dict, and the ids map back through _TAG_KEYS / _TAG_VALUES
+_TAG_DTYPE = np.uint32  # Room for 4 billion distinct keys/values, not 65,536
+_TAG_KEY_INTERN = {}
+_TAG_VAL_INTERN = {}
+_TAG_KEYS = []
+_TAG_VALUES = []
+_NO_TAGS = np.empty((0, 2), dtype=_TAG_DTYPE)  # Shared by untagged resources; add_tag() never writes into it
+
+def _intern(table, inverse, text):
+    """Return the integer id for text, assigning a new one if needed"""
+    code = table.get(text)
+    if code is None:
+        code = table[text] = len(inverse)
+        inverse.append(text)
+    return code
+
+def _encode_tags(tags):
+    """Encode a tag dict as an (n, 2) _TAG_DTYPE array of (key_id, value_id) rows"""
+    pairs = [(_intern(_TAG_KEY_INTERN, _TAG_KEYS, key), _intern(_TAG_VAL_INTERN, _TAG_VALUES, value))
+             for key, value in tags.items()]
+    if not pairs:
+        return _NO_TAGS
+    return np.array(pairs, dtype=_TAG_DTYPE)
+
 class AzureResource(ABC):
     """
     Abstract base class for all Azure resources
-    Demonstrates: Inheritance, Encapsulation, Abstract Methods
+    Demonstrates: Inheritance, Encapsulation, Abstract Methods, __slots__
     """
     
+    # Fixed attribute layout - no per-instance __dict__
+    __slots__ = ("_name", "_resource_group", "_location", "_tag_kv",
+                 "_created_at", "_status", "_resource_id", "_type_name",
+                 "_str_cache", "_repr_cache")
+    
     # Class variable (shared by all instances)
     total_resources = 0
     
+    # Bumped whenever a resource changes in a way that affects its cost,
+    # so ResourceGroup knows when its cached cost array is stale
+    cost_version = 0
+    # Same idea for tag changes (ResourceGroup's tag index)
+    tag_version = 0
+    
     def __init__(self, name, resource_group, location, tags=None):
         # Instance variables (encapsulation - private data)
         self._name = name
         self._resource_group = resource_group
         self._location = location
-        self._tags = tags or {}
+        self._tag_kv = _encode_tags(tags or {})
         self._created_at = datetime.now()
         self._status = "Running"
-        self._resource_id = f"/subscriptions/sub-{random.randint(1000,9999)}/resourceGroups/{resource_group}/providers/{self.__class__.__name__}/{name}"
+        self._type_name = type(self).__name__  # Cached for display code
+        self._str_cache = None   # Built on first str(), reset on status change
+        self._repr_cache = None  # Name and type never change, so never reset
+        self._resource_id = f"/subscriptions/sub-{random.randint(1000,9999)}/resourceGroups/{resource_group}/providers/{self._type_name}/{name}"
         
         # Increment class variable
         AzureResource.total_resources += 1
@@ -49,17 +101,39 @@ class AzureResource(ABC):
     def resource_id(self):
         return self._resource_id
     
+    @property
+    def resource_type(self):
+        return self._type_name
+    
     # Abstract method - must be implemented by subclasses
     @abstractmethod
     def calculate_cost(self):
         """Calculate monthly cost - each resource type implements differently"""
         pass
     
+    @classmethod
+    def batch_cost(cls, resources):
+        """
+        Monthly cost of several resources of this class as a NumPy array
+        Subclasses override this with a vectorized form of calculate_cost()
+        """
+        # Every resource in a batch has exactly this class, so resolve the
+        # method once and call the plain function instead of a bound method
+        cost_fn = cls.calculate_cost
+        return np.fromiter((cost_fn(r) for r in resources),
+                           dtype=np.float64, count=len(resources))
+    
+    def _cost_changed(self):
+        """Invalidate cached costs after a cost-affecting change"""
+        AzureResource.cost_version += 1
+    
     # Concrete methods (shared by all resources)
     def start(self):
         """Start the resource"""
         if self._status == "Stopped":
             self._status = "Running"
+            self._str_cache = None
+            self._cost_changed()
             return f"✅ {self._name} started"
         return f"ℹ️  {self._name} is already running"
     
@@ -67,33 +141,61 @@ class AzureResource(ABC):
         """Stop the resource"""
         if self._status == "Running":
             self._status = "Stopped"
+            self._str_cache = None
+            self._cost_changed()
             return f"✅ {self._name} stopped"
         return f"ℹ️  {self._name} is already stopped"
     
     def add_tag(self, key, value):
         """Add a tag to the resource"""
-        self._tags[key] = value
+        key_id = _intern(_TAG_KEY_INTERN, _TAG_KEYS, key)
+        value_id = _intern(_TAG_VAL_INTERN, _TAG_VALUES, value)
+        existing = np.flatnonzero(self._tag_kv[:, 0] == key_id)
+        if existing.size:
+            self._tag_kv[existing[0], 1] = value_id
+        else:
+            self._tag_kv = np.append(self._tag_kv, np.array([[key_id, value_id]], dtype=_TAG_DTYPE), axis=0)
+        AzureResource.tag_version += 1
         return f"✅ Tag added: {key}={value}"
     
+    def _tag_dict(self):
+        """Rebuild the tag dict from the interned codes"""
+        return {_TAG_KEYS[key_id]: _TAG_VALUES[value_id] for key_id, value_id in self._tag_kv.tolist()}
+    
     def get_info(self):
         """Get resource information"""
         return {
             'name': self._name,
-            'type': self.__class__.__name__,
+            'type': self._type_name,
             'resource_group': self._resource_group,
             'location': self._location,
             'status': self._status,
             'created': self._created_at.strftime('%Y-%m-%d'),
-            'tags': self._tags
+            'tags': self._tag_dict()
         }
     
+    def fill_columns(self, i, cols):
+        """Write resource information into row i of column buffers (no dict per resource)"""
+        cols['name'][i] = self._name
+        cols['type'][i] = self._type_name
+        cols['resource_group'][i] = self._resource_group
+        cols['location'][i] = self._location
+        cols['status'][i] = self._status
+        cols['created'][i] = self._created_at.strftime('%Y-%m-%d')
+        cols['tags'][i] = self._tag_dict()
+        cols['monthly_cost'][i] = self.calculate_cost()
+    
     def __str__(self):
         """String representation"""
-        return f"{self.__class__.__name__}(name='{self._name}', status='{self._status}')"
+        if self._str_cache is None:
+            self._str_cache = f"{self._type_name}(name='{self._name}', status='{self._status}')"
+        return self._str_cache
     
     def __repr__(self):
         """Developer representation"""
-        return f"<{self.__class__.__name__} {self._name}>"
+        if self._repr_cache is None:
+            self._repr_cache = f"<{self._type_name} {self._name}>"
+        return self._repr_cache
 
 print("✅ Base class 'AzureResource' created")
 print("   • Demonstrates: Abstract base class, encapsulation, properties")
@@ -106,21 +208,30 @@ print("\n" + "=" * 70)
 print("🔨 CREATING CONCRETE RESOURCE CLASSES")
 print("=" * 70)
 
+# Hourly price per VM size (read-only)
+VM_PRICING = MappingProxyType({
+    "Standard_B1s": 0.0104,
+    "Standard_B2s": 0.0416,
+    "Standard_D2s_v3": 0.096,
+    "Standard_D4s_v3": 0.192,
+    "Standard_E4s_v3": 0.252,
+    "Standard_E8s_v3": 0.504
+})
+
+# Vectorized form: VM_SIZE_PRICES[VM_SIZE_INDEX[size]] (last slot is the default rate)
+VM_SIZE_INDEX = MappingProxyType({size: i for i, size in enumerate(VM_PRICING)})
+VM_SIZE_PRICES = np.array([*VM_PRICING.values(), 0.10])
+
 class VirtualMachine(AzureResource):
     """
     Azure Virtual Machine
     Demonstrates: Inheritance, Method Overriding, Additional Properties
     """
     
-    # Class variable for pricing
-    VM_PRICING = {
-        "Standard_B1s": 0.0104,
-        "Standard_B2s": 0.0416,
-        "Standard_D2s_v3": 0.096,
-        "Standard_D4s_v3": 0.192,
-        "Standard_E4s_v3": 0.252,
-        "Standard_E8s_v3": 0.504
-    }
+    __slots__ = ("_vm_size", "_os_type", "_uptime_hours")
+    
+    # Class variable for pricing (alias of the module-level table)
+    VM_PRICING = VM_PRICING
     
     def __init__(self, name, resource_group, location, vm_size, os_type="Linux", tags=None):
         super().__init__(name, resource_group, location, tags)
@@ -137,17 +248,28 @@ class VirtualMachine(AzureResource):
         if self._status == "Stopped":
             return 0  # Deallocated VMs don't incur compute costs
         
-        hourly_rate = self.VM_PRICING.get(self._vm_size, 0.10)
+        hourly_rate = VM_PRICING.get(self._vm_size, 0.10)
         return hourly_rate * hours
     
+    @classmethod
+    def batch_cost(cls, vms, hours=730):
+        """Vectorized calculate_cost() for a list of VMs"""
+        n = len(vms)
+        default_idx = len(VM_SIZE_INDEX)
+        size_idx = np.fromiter((VM_SIZE_INDEX.get(vm._vm_size, default_idx) for vm in vms),
+                               dtype=np.intp, count=n)
+        running = np.fromiter((vm._status != "Stopped" for vm in vms), dtype=bool, count=n)
+        return np.where(running, VM_SIZE_PRICES[size_idx] * hours, 0.0)
+    
     def resize(self, new_size):
         """Change VM size"""
-        if new_size not in self.VM_PRICING:
+        if new_size not in VM_PRICING:
             return f"❌ Invalid VM size: {new_size}"
         
         old_size = self._vm_size
         old_cost = self.calculate_cost()
         self._vm_size = new_size
+        self._cost_changed()
         new_cost = self.calculate_cost()
         savings = old_cost - new_cost
         
@@ -157,20 +279,30 @@ class VirtualMachine(AzureResource):
         """Restart the VM"""
         self._status = "Restarting"
         self._status = "Running"
+        self._str_cache = None
+        self._cost_changed()
         return f"✅ {self._name} restarted"
 
 
+# Price per GB/month by access tier (read-only)
+TIER_PRICING = MappingProxyType({
+    "Hot": 0.0184,      # per GB/month
+    "Cool": 0.01,       # per GB/month
+    "Archive": 0.00099  # per GB/month
+})
+
+STORAGE_TIER_INDEX = MappingProxyType({tier: i for i, tier in enumerate(TIER_PRICING)})
+STORAGE_TIER_PRICES = np.array(list(TIER_PRICING.values()))
+
 class StorageAccount(AzureResource):
     """
     Azure Storage Account
     Demonstrates: Different implementation of abstract methods
     """
     
-    TIER_PRICING = {
-        "Hot": 0.0184,      # per GB/month
-        "Cool": 0.01,       # per GB/month
-        "Archive": 0.00099  # per GB/month
-    }
+    __slots__ = ("_storage_gb", "_tier")
+    
+    TIER_PRICING = TIER_PRICING
     
     def __init__(self, name, resource_group, location, storage_gb=100, tier="Hot", tags=None):
         super().__init__(name, resource_group, location, tags)
@@ -187,16 +319,25 @@ class StorageAccount(AzureResource):
     
     def calculate_cost(self, hours=730):
         """Calculate storage cost"""
-        return self._storage_gb * self.TIER_PRICING[self._tier]
+        return self._storage_gb * TIER_PRICING[self._tier]
+    
+    @classmethod
+    def batch_cost(cls, accounts, hours=730):
+        """Vectorized calculate_cost() for a list of storage accounts"""
+        n = len(accounts)
+        storage_gb = np.fromiter((a._storage_gb for a in accounts), dtype=np.float64, count=n)
+        tier_idx = np.fromiter((STORAGE_TIER_INDEX[a._tier] for a in accounts), dtype=np.intp, count=n)
+        return storage_gb * STORAGE_TIER_PRICES[tier_idx]
     
     def change_tier(self, new_tier):
         """Change access tier"""
-        if new_tier not in self.TIER_PRICING:
+        if new_tier not in TIER_PRICING:
             return f"❌ Invalid tier: {new_tier}"
         
         old_tier = self._tier
         old_cost = self.calculate_cost()
         self._tier = new_tier
+        self._cost_changed()
         new_cost = self.calculate_cost()
         savings = old_cost - new_cost
         
@@ -205,23 +346,33 @@ class StorageAccount(AzureResource):
     def add_storage(self, gb):
         """Increase storage capacity"""
         self._storage_gb += gb
+        self._cost_changed()
         return f"✅ Added {gb}GB storage (Total: {self._storage_gb}GB)"
 
 
+# Monthly compute price per DTU tier (read-only)
+DTU_PRICING = MappingProxyType({
+    "Basic": 4.99,
+    "S0": 15.00,
+    "S1": 30.00,
+    "S2": 75.00,
+    "S3": 150.00,
+    "P1": 465.00
+})
+
+# Last slot is the default rate for unknown tiers
+SQL_TIER_INDEX = MappingProxyType({tier: i for i, tier in enumerate(DTU_PRICING)})
+SQL_TIER_PRICES = np.array([*DTU_PRICING.values(), 30.00])
+
 class SQLDatabase(AzureResource):
     """
     Azure SQL Database
     Demonstrates: More complex cost calculation
     """
     
-    DTU_PRICING = {
-        "Basic": 4.99,
-        "S0": 15.00,
-        "S1": 30.00,
-        "S2": 75.00,
-        "S3": 150.00,
-        "P1": 465.00
-    }
+    __slots__ = ("_tier", "_storage_gb", "_backup_enabled")
+    
+    DTU_PRICING = DTU_PRICING
     
     def __init__(self, name, resource_group, location, tier="S0", storage_gb=250, tags=None):
         super().__init__(name, resource_group, location, tags)
@@ -231,37 +382,57 @@ class SQLDatabase(AzureResource):
     
     def calculate_cost(self, hours=730):
         """Calculate SQL DB cost (compute + storage)"""
-        compute_cost = self.DTU_PRICING.get(self._tier, 30.00)
+        compute_cost = DTU_PRICING.get(self._tier, 30.00)
         storage_cost = self._storage_gb * 0.115  # $0.115 per GB/month
         backup_cost = 10 if self._backup_enabled else 0
         return compute_cost + storage_cost + backup_cost
     
+    @classmethod
+    def batch_cost(cls, databases, hours=730):
+        """Vectorized calculate_cost() for a list of SQL databases"""
+        n = len(databases)
+        default_idx = len(SQL_TIER_INDEX)
+        tier_idx = np.fromiter((SQL_TIER_INDEX.get(db._tier, default_idx) for db in databases),
+                               dtype=np.intp, count=n)
+        storage_gb = np.fromiter((db._storage_gb for db in databases), dtype=np.float64, count=n)
+        backup = np.fromiter((db._backup_enabled for db in databases), dtype=bool, count=n)
+        return SQL_TIER_PRICES[tier_idx] + storage_gb * 0.115 + np.where(backup, 10.0, 0.0)
+    
     def scale_tier(self, new_tier):
         """Scale database tier"""
-        if new_tier not in self.DTU_PRICING:
+        if new_tier not in DTU_PRICING:
             return f"❌ Invalid tier: {new_tier}"
         
         old_tier = self._tier
         old_cost = self.calculate_cost()
         self._tier = new_tier
+        self._cost_changed()
         new_cost = self.calculate_cost()
         
         return f"✅ Scaled from {old_tier} to {new_tier} (Monthly: ${old_cost:.2f} → ${new_cost:.2f})"
 
 
+# Monthly price per App Service plan instance (read-only)
+PLAN_PRICING = MappingProxyType({
+    "Free": 0,
+    "Shared": 9.49,
+    "Basic": 54.75,
+    "Standard": 146.00,
+    "Premium": 292.00
+})
+
+APP_PLAN_INDEX = MappingProxyType({plan: i for i, plan in enumerate(PLAN_PRICING)})
+APP_PLAN_PRICES = np.array(list(PLAN_PRICING.values()), dtype=np.float64)
+
 class AppService(AzureResource):
     """
     Azure App Service
     Demonstrates: Additional methods and state management
     """
     
-    PLAN_PRICING = {
-        "Free": 0,
-        "Shared": 9.49,
-        "Basic": 54.75,
-        "Standard": 146.00,
-        "Premium": 292.00
-    }
+    __slots__ = ("_plan", "_instances", "_auto_scale", "_min_instances", "_max_instances")
+    
+    PLAN_PRICING = PLAN_PRICING
     
     def __init__(self, name, resource_group, location, plan="Basic", instances=1, tags=None):
         super().__init__(name, resource_group, location, tags)
@@ -271,7 +442,15 @@ class AppService(AzureResource):
     
     def calculate_cost(self, hours=730):
         """Calculate App Service cost"""
-        return self.PLAN_PRICING[self._plan] * self._instances
+        return PLAN_PRICING[self._plan] * self._instances
+    
+    @classmethod
+    def batch_cost(cls, apps, hours=730):
+        """Vectorized calculate_cost() for a list of App Services"""
+        n = len(apps)
+        plan_idx = np.fromiter((APP_PLAN_INDEX[app._plan] for app in apps), dtype=np.intp, count=n)
+        instances = np.fromiter((app._instances for app in apps), dtype=np.float64, count=n)
+        return APP_PLAN_PRICES[plan_idx] * instances
     
     def scale_out(self, new_instance_count):
         """Scale out (add instances)"""
@@ -280,6 +459,7 @@ class AppService(AzureResource):
         
         old_cost = self.calculate_cost()
         self._instances = new_instance_count
+        self._cost_changed()
         new_cost = self.calculate_cost()
         
         return f"✅ Scaled to {new_instance_count} instances (Monthly: ${old_cost:.2f} → ${new_cost:.2f})"
@@ -292,6 +472,10 @@ class AppService(AzureResource):
         return f"✅ Auto-scale enabled: {min_instances}-{max_instances} instances"
 
 
+# Known resource type names, used as fixed categories in the CELL 8 report
+_RESOURCE_TYPE_NAMES = tuple(sorted(cls.__name__ for cls in
+                                    (VirtualMachine, StorageAccount, SQLDatabase, AppService)))
+
 print("✅ Created 4 concrete resource classes:")
 print("   • VirtualMachine - with resize() method")
 print("   • StorageAccount - with change_tier() method")
@@ -306,6 +490,11 @@ print("\n" + "=" * 70)
 print("📦 CREATING RESOURCE GROUP MANAGER")
 print("=" * 70)
 
+def _defining_class(cls, attr):
+    """First class in cls's MRO whose own namespace defines attr"""
+    return next(klass for klass in cls.__mro__ if attr in vars(klass))
+
+
 class ResourceGroup:
     """
     Azure Resource Group - manages multiple resources
@@ -316,6 +505,12 @@ class ResourceGroup:
         self._name = name
         self._location = location
         self._resources = []  # Composition - contains other objects
+        self._by_name = {}    # Index for O(1) lookup by name
+        self._by_type = {}    # Exact class -> resources of that class
+        self._costs_cache = None  # Per-resource monthly costs (np.ndarray)
+        self._costs_version = -1
+        self._tags_cache = None   # (owner row, tag codes) for tag filtering
+        self._tags_version = -1
         self._created_at = datetime.now()
     
     @property
@@ -326,49 +521,108 @@ class ResourceGroup:
         """Add a resource to the group"""
         if not isinstance(resource, AzureResource):
             return "❌ Must be an AzureResource instance"
+        if resource.name in self._by_name:
+            return f"❌ {resource.name} already exists in {self._name}"
         
+        self._by_name[resource.name] = resource
+        self._by_type.setdefault(type(resource), []).append(resource)
         self._resources.append(resource)
+        self._costs_cache = None
+        self._tags_cache = None
         return f"✅ Added {resource.name} to {self._name}"
     
+    def add_resources(self, resources):
+        """Add several resources at once (all or nothing), invalidating caches once"""
+        resources = list(resources)
+        names = set()
+        for resource in resources:
+            if not isinstance(resource, AzureResource):
+                return "❌ Must be an AzureResource instance"
+            if resource.name in self._by_name or resource.name in names:
+                return f"❌ {resource.name} already exists in {self._name}"
+            names.add(resource.name)
+        
+        for resource in resources:
+            self._by_name[resource.name] = resource
+            self._by_type.setdefault(type(resource), []).append(resource)
+        self._resources.extend(resources)
+        self._costs_cache = None
+        self._tags_cache = None
+        return f"✅ Added {len(resources)} resources to {self._name}"
+    
     def remove_resource(self, resource_name):
         """Remove a resource by name"""
-        self._resources = [r for r in self._resources if r.name != resource_name]
+        resource = self._by_name.pop(resource_name, None)
+        if resource is None:
+            return f"❌ {resource_name} not found in {self._name}"
+        
+        self._resources.remove(resource)  # In place, no list rebuild
+        self._by_type[type(resource)].remove(resource)
+        self._costs_cache = None
+        self._tags_cache = None
         return f"✅ Removed {resource_name} from {self._name}"
     
     def get_resource(self, name):
         """Find a resource by name"""
-        for resource in self._resources:
-            if resource.name == name:
-                return resource
-        return None
+        return self._by_name.get(name)
     
-    def list_resources(self):
-        """List all resources"""
-        if not self._resources:
-            return f"ℹ️  No resources in {self._name}"
+    def calculate_all_costs(self):
+        """Monthly cost of every resource (in group order), one vectorized batch per class"""
+        rows_by_type = {}
+        for i, resource in enumerate(self._resources):
+            rows_by_type.setdefault(type(resource), []).append(i)
         
-        print(f"\n{'='*70}")
-        print(f"📦 Resource Group: {self._name} ({self._location})")
-        print(f"{'='*70}")
-        print(f"{'Resource Name':<25} {'Type':<20} {'Status':<12} {'Monthly Cost':<15}")
-        print(f"{'-'*70}")
-        
-        total_cost = 0
-        for resource in self._resources:
-            cost = resource.calculate_cost()
-            total_cost += cost
-            resource_type = resource.__class__.__name__
-            print(f"{resource.name:<25} {resource_type:<20} {resource.status:<12} ${cost:>12.2f}")
+        costs = np.empty(len(self._resources), dtype=np.float64)
+        for resource_class, rows in rows_by_type.items():
+            members = [self._resources[i] for i in rows]
+            if _defining_class(resource_class, "batch_cost") is _defining_class(resource_class, "calculate_cost"):
+                costs[rows] = resource_class.batch_cost(members)
+            else:
+                # A subclass overrode calculate_cost() but inherited a batch_cost()
+                # written for its parent - use the generic per-resource loop
+                costs[rows] = AzureResource.batch_cost.__func__(resource_class, members)
+        return costs
+    
+    def _costs(self):
+        """Monthly cost of each resource, recomputed only after a change"""
+        if self._costs_cache is None or self._costs_version != AzureResource.cost_version:
+            self._costs_cache = self.calculate_all_costs()
+            self._costs_version = AzureResource.cost_version
+        return self._costs_cache
+    
+    def print_inventory(self, out=None):
+        """Print a cost table of all resources (to out, default sys.stdout) in one write"""
+        if out is None:
+            out = sys.stdout
+        if not self._resources:
+            out.write(f"ℹ️  No resources in {self._name}\n")
+            return
         
-        print(f"{'-'*70}")
-        print(f"{'Total Resources: ' + str(len(self._resources)):<58} ${total_cost:>12.2f}")
-        print(f"{'='*70}\n")
+        lines = [
+            f"\n{'='*70}",
+            f"📦 Resource Group: {self._name} ({self._location})",
+            f"{'='*70}",
+            f"{'Resource Name':<25} {'Type':<20} {'Status':<12} {'Monthly Cost':<15}",
+            f"{'-'*70}",
+        ]
+        for resource, cost in zip(self._resources, self._costs()):
+            lines.append(f"{resource.name:<25} {resource.resource_type:<20} {resource.status:<12} ${cost:>12.2f}")
+        lines.append(f"{'-'*70}")
+        lines.append(f"{'Total Resources: ' + str(len(self._resources)):<58} ${self.total_cost():>12.2f}")
+        lines.append(f"{'='*70}\n")
+        out.write("\n".join(lines) + "\n")
+    
+    def list_resources(self, out=None):
+        """List all resources and return their total monthly cost"""
+        if not self._resources:
+            return f"ℹ️  No resources in {self._name}"
         
-        return total_cost
+        self.print_inventory(out)
+        return self.total_cost()
     
     def total_cost(self):
         """Calculate total cost of all resources"""
-        return sum(resource.calculate_cost() for resource in self._resources)
+        return float(self._costs().sum())
     
     def start_all(self):
         """Start all resources"""
@@ -382,8 +636,35 @@ class ResourceGroup:
     
     def get_resources_by_type(self, resource_type):
         """Filter resources by type"""
+        exact = self._by_type.get(resource_type, [])
+        # Fast path: no subclasses of resource_type in the group
+        if all(cls is resource_type or not issubclass(cls, resource_type) for cls in self._by_type):
+            return list(exact)
         return [r for r in self._resources if isinstance(r, resource_type)]
     
+    def _tag_index(self):
+        """All resources' tag codes in one array, plus the owning row of each tag"""
+        if self._tags_cache is None or self._tags_version != AzureResource.tag_version:
+            arrays = [resource._tag_kv for resource in self._resources]
+            owners = np.repeat(np.arange(len(arrays)), [len(a) for a in arrays])
+            codes = np.concatenate(arrays) if arrays else _NO_TAGS
+            self._tags_cache = (owners, codes)
+            self._tags_version = AzureResource.tag_version
+        return self._tags_cache
+    
+    def get_resources_by_tag(self, key, value=None):
+        """Filter resources by tag key (and optionally value) with a vectorized comparison"""
+        key_id = _TAG_KEY_INTERN.get(key)
+        value_id = _TAG_VAL_INTERN.get(value) if value is not None else None
+        if key_id is None or (value is not None and value_id is None):
+            return []  # Never-seen strings cannot match
+        
+        owners, codes = self._tag_index()
+        mask = codes[:, 0] == key_id
+        if value_id is not None:
+            mask &= codes[:, 1] == value_id
+        return [self._resources[row] for row in owners[mask]]
+    
     def __len__(self):
         """Support len() function"""
         return len(self._resources)
@@ -404,16 +685,17 @@ print("   • Supports: iteration, len(), resource filtering")
 # ============================================================================
 # CELL 4: Building a Complete Azure Environment
 # ============================================================================
-print("\n" + "=" * 70)
-print("🏗️  BUILDING AZURE ENVIRONMENT")
-print("=" * 70)
+_buf = io.StringIO()  # Buffer the cell output, write once at the end
+print("\n" + "=" * 70, file=_buf)
+print("🏗️  BUILDING AZURE ENVIRONMENT", file=_buf)
+print("=" * 70, file=_buf)
 
 # Create resource groups
 rg_production = ResourceGroup("rg-production", "East US")
 rg_development = ResourceGroup("rg-development", "West US")
 
 # Create Production resources
-print("\n📦 Creating Production Resources...")
+print("\n📦 Creating Production Resources...", file=_buf)
 
 vm_web = VirtualMachine(
     "vm-web-prod-01",
@@ -464,85 +746,87 @@ app_prod = AppService(
 )
 
 # Add to resource group
-rg_production.add_resource(vm_web)
-rg_production.add_resource(vm_db)
-rg_production.add_resource(storage_data)
-rg_production.add_resource(storage_backup)
-rg_production.add_resource(sql_prod)
-rg_production.add_resource(app_prod)
+rg_production.add_resources([vm_web, vm_db, storage_data, storage_backup, sql_prod, app_prod])
 
-print(f"✅ Created {len(rg_production)} production resources")
+n_prod = len(rg_production)  # Membership is fixed from here on, so count once
+print(f"✅ Created {n_prod} production resources", file=_buf)
 
 # Create Development resources
-print("\n📦 Creating Development Resources...")
+print("\n📦 Creating Development Resources...", file=_buf)
 
 vm_dev = VirtualMachine("vm-dev-01", "rg-development", "West US", "Standard_B2s")
 storage_dev = StorageAccount("stdev001", "rg-development", "West US", 100, "Hot")
 sql_dev = SQLDatabase("sqldev001", "rg-development", "West US", "Basic", 50)
 app_dev = AppService("app-dev", "rg-development", "West US", "Basic", 1)
 
-rg_development.add_resource(vm_dev)
-rg_development.add_resource(storage_dev)
-rg_development.add_resource(sql_dev)
-rg_development.add_resource(app_dev)
+rg_development.add_resources([vm_dev, storage_dev, sql_dev, app_dev])
 
-print(f"✅ Created {len(rg_development)} development resources")
+n_dev = len(rg_development)
+print(f"✅ Created {n_dev} development resources", file=_buf)
 
-print(f"\n📊 Total Azure Resources: {AzureResource.total_resources}")
+print(f"\n📊 Total Azure Resources: {AzureResource.total_resources}", file=_buf)
+sys.stdout.write(_buf.getvalue())
 
 
 # ============================================================================
 # CELL 5: Resource Operations - Polymorphism in Action
 # ============================================================================
-print("\n" + "=" * 70)
-print("⚙️  PERFORMING RESOURCE OPERATIONS")
-print("=" * 70)
+_buf = io.StringIO()  # Buffer the cell output, write once at the end
+print("\n" + "=" * 70, file=_buf)
+print("⚙️  PERFORMING RESOURCE OPERATIONS", file=_buf)
+print("=" * 70, file=_buf)
 
 # Display current state
-print("\n📋 CURRENT ENVIRONMENT STATE:")
-print("\nProduction:")
-prod_cost = rg_production.list_resources()
+print("\n📋 CURRENT ENVIRONMENT STATE:", file=_buf)
+print("\nProduction:", file=_buf)
+rg_production.print_inventory(_buf)
+prod_cost = rg_production.total_cost()
 
-print("Development:")
-dev_cost = rg_development.list_resources()
+print("Development:", file=_buf)
+rg_development.print_inventory(_buf)
+dev_cost = rg_development.total_cost()
 
-print(f"💰 Total Monthly Cost: ${prod_cost + dev_cost:.2f}")
+print(f"💰 Total Monthly Cost: ${prod_cost + dev_cost:.2f}", file=_buf)
 
 # Perform optimization operations
-print("\n" + "=" * 70)
-print("🔧 OPTIMIZATION OPERATIONS")
-print("=" * 70)
+print("\n" + "=" * 70, file=_buf)
+print("🔧 OPTIMIZATION OPERATIONS", file=_buf)
+print("=" * 70, file=_buf)
 
-print("\n1️⃣ Resizing oversized VMs...")
-print(vm_web.resize("Standard_D2s_v3"))  # Downsize web server
+print("\n1️⃣ Resizing oversized VMs...", file=_buf)
+print(vm_web.resize("Standard_D2s_v3"), file=_buf)  # Downsize web server
 
-print("\n2️⃣ Optimizing storage tiers...")
-print(storage_backup.change_tier("Archive"))  # Move backups to cheapest tier
+print("\n2️⃣ Optimizing storage tiers...", file=_buf)
+print(storage_backup.change_tier("Archive"), file=_buf)  # Move backups to cheapest tier
 
-print("\n3️⃣ Scaling down development environment...")
-print(app_dev.scale_out(1))  # Ensure dev uses only 1 instance
-print(sql_dev.scale_tier("Basic"))  # Use smallest SQL tier
+print("\n3️⃣ Scaling down development environment...", file=_buf)
+print(app_dev.scale_out(1), file=_buf)  # Ensure dev uses only 1 instance
+print(sql_dev.scale_tier("Basic"), file=_buf)  # Use smallest SQL tier
 
-print("\n4️⃣ Stopping non-critical resources...")
-print(vm_dev.stop())  # Stop dev VM when not in use
+print("\n4️⃣ Stopping non-critical resources...", file=_buf)
+print(vm_dev.stop(), file=_buf)  # Stop dev VM when not in use
 
-print("\n5️⃣ Enabling auto-scale for production app...")
-print(app_prod.enable_auto_scale(min_instances=2, max_instances=5))
+print("\n5️⃣ Enabling auto-scale for production app...", file=_buf)
+print(app_prod.enable_auto_scale(min_instances=2, max_instances=5), file=_buf)
+sys.stdout.write(_buf.getvalue())
 
 
 # ============================================================================
 # CELL 6: Cost Analysis After Optimization
 # ============================================================================
-print("\n" + "=" * 70)
-print("📊 COST ANALYSIS AFTER OPTIMIZATION")
-print("=" * 70)
+_buf = io.StringIO()  # Buffer the cell output, write once at the end
+print("\n" + "=" * 70, file=_buf)
+print("📊 COST ANALYSIS AFTER OPTIMIZATION", file=_buf)
+print("=" * 70, file=_buf)
 
-print("\n📋 OPTIMIZED ENVIRONMENT STATE:")
-print("\nProduction:")
-new_prod_cost = rg_production.list_resources()
+print("\n📋 OPTIMIZED ENVIRONMENT STATE:", file=_buf)
+print("\nProduction:", file=_buf)
+rg_production.print_inventory(_buf)
+new_prod_cost = rg_production.total_cost()
 
-print("Development:")
-new_dev_cost = rg_development.list_resources()
+print("Development:", file=_buf)
+rg_development.print_inventory(_buf)
+new_dev_cost = rg_development.total_cost()
 
 new_total_cost = new_prod_cost + new_dev_cost
 old_total_cost = prod_cost + dev_cost
@@ -550,142 +834,185 @@ old_total_cost = prod_cost + dev_cost
 savings = old_total_cost - new_total_cost
 savings_pct = (savings / old_total_cost) * 100
 
-print(f"\n{'='*70}")
-print("💰 COST COMPARISON")
-print(f"{'='*70}")
-print(f"Before Optimization: ${old_total_cost:>10.2f}/month")
-print(f"After Optimization:  ${new_total_cost:>10.2f}/month")
-print(f"{'-'*70}")
-print(f"Monthly Savings:     ${savings:>10.2f} ({savings_pct:.1f}%)")
-print(f"Annual Savings:      ${savings * 12:>10.2f}")
-print(f"{'='*70}")
+print(f"\n{'='*70}", file=_buf)
+print("💰 COST COMPARISON", file=_buf)
+print(f"{'='*70}", file=_buf)
+print(f"Before Optimization: ${old_total_cost:>10.2f}/month", file=_buf)
+print(f"After Optimization:  ${new_total_cost:>10.2f}/month", file=_buf)
+print(f"{'-'*70}", file=_buf)
+print(f"Monthly Savings:     ${savings:>10.2f} ({savings_pct:.1f}%)", file=_buf)
+print(f"Annual Savings:      ${savings * 12:>10.2f}", file=_buf)
+print(f"{'='*70}", file=_buf)
+sys.stdout.write(_buf.getvalue())
 
 
 # ============================================================================
 # CELL 7: Advanced OOP Features - Special Methods
 # ============================================================================
-print("\n" + "=" * 70)
-print("🎓 DEMONSTRATING ADVANCED OOP FEATURES")
-print("=" * 70)
+_buf = io.StringIO()  # Buffer the cell output, write once at the end
+print("\n" + "=" * 70, file=_buf)
+print("🎓 DEMONSTRATING ADVANCED OOP FEATURES", file=_buf)
+print("=" * 70, file=_buf)
 
-print("\n1️⃣ Using __str__ and __repr__:")
-print(f"String representation: {vm_web}")
-print(f"Developer representation: {repr(vm_web)}")
+print("\n1️⃣ Using __str__ and __repr__:", file=_buf)
+print(f"String representation: {vm_web}", file=_buf)
+print(f"Developer representation: {repr(vm_web)}", file=_buf)
 
-print("\n2️⃣ Iteration over resource group:")
-print("Iterating through production resources:")
+print("\n2️⃣ Iteration over resource group:", file=_buf)
+print("Iterating through production resources:", file=_buf)
 for resource in rg_production:
-    print(f"  • {resource.name} ({resource.__class__.__name__})")
+    print(f"  • {resource.name} ({resource.resource_type})", file=_buf)
 
-print("\n3️⃣ Using len() on resource group:")
-print(f"Production has {len(rg_production)} resources")
-print(f"Development has {len(rg_development)} resources")
+print("\n3️⃣ Using len() on resource group:", file=_buf)
+print(f"Production has {len(rg_production)} resources", file=_buf)
+print(f"Development has {len(rg_development)} resources", file=_buf)
 
-print("\n4️⃣ Property access (encapsulation):")
-print(f"VM Name (via property): {vm_web.name}")
-print(f"VM Status (via property): {vm_web.status}")
-print(f"VM Size (via property): {vm_web.vm_size}")
+print("\n4️⃣ Property access (encapsulation):", file=_buf)
+print(f"VM Name (via property): {vm_web.name}", file=_buf)
+print(f"VM Status (via property): {vm_web.status}", file=_buf)
+print(f"VM Size (via property): {vm_web.vm_size}", file=_buf)
 
-print("\n5️⃣ Type checking and filtering:")
+print("\n5️⃣ Type checking and filtering:", file=_buf)
 all_vms = rg_production.get_resources_by_type(VirtualMachine)
 all_storage = rg_production.get_resources_by_type(StorageAccount)
-print(f"Production VMs: {len(all_vms)}")
-print(f"Production Storage Accounts: {len(all_storage)}")
+print(f"Production VMs: {len(all_vms)}", file=_buf)
+print(f"Production Storage Accounts: {len(all_storage)}", file=_buf)
+web_tier = rg_production.get_resources_by_tag("Application", "Web")
+print(f"Production resources tagged Application=Web: {len(web_tier)}", file=_buf)
 
-print("\n6️⃣ Polymorphism - calculate_cost() works for all resource types:")
-for resource in rg_production:
-    cost = resource.calculate_cost()  # Same method, different implementations
-    print(f"  {resource.name}: ${cost:.2f}/month")
+print("\n6️⃣ Polymorphism - calculate_cost() works for all resource types:", file=_buf)
+# Call each resource's own calculate_cost(); np.char.mod only formats the column
+costs = np.fromiter((resource.calculate_cost() for resource in rg_production),
+                    dtype=np.float64, count=len(rg_production))
+cost_strs = np.char.mod('$%.2f/month', costs)
+print("\n".join(f"  {resource.name}: {cost_str}" for resource, cost_str in zip(rg_production, cost_strs)),
+      file=_buf)
+sys.stdout.write(_buf.getvalue())
 
 
 # ============================================================================
 # CELL 8: Create Comprehensive Report
 # ============================================================================
-print("\n" + "=" * 70)
-print("📋 GENERATING COMPREHENSIVE REPORT")
-print("=" * 70)
-
-# Collect all resources
-all_resources = []
-for rg in [rg_production, rg_development]:
+_buf = io.StringIO()  # Buffer the cell output, write once at the end
+print("\n" + "=" * 70, file=_buf)
+print("📋 GENERATING COMPREHENSIVE REPORT", file=_buf)
+print("=" * 70, file=_buf)
+
+# Collect all resources into preallocated columns (one buffer per field)
+resource_groups = [rg_production, rg_development]
+n_rows = n_prod + n_dev
+cols = {field: [None] * n_rows
+        for field in ('name', 'type', 'resource_group', 'location', 'status', 'created', 'tags')}
+cols['monthly_cost'] = np.empty(n_rows, dtype=np.float64)
+
+row_idx = 0
+for rg in resource_groups:
     for resource in rg:
-        info = resource.get_info()
-        info['resource_group'] = rg.name
-        info['monthly_cost'] = resource.calculate_cost()
-        all_resources.append(info)
-
-# Create DataFrame for analysis
-import pandas as pd
-df_resources = pd.DataFrame(all_resources)
+        resource.fill_columns(row_idx, cols)
+        cols['resource_group'][row_idx] = rg.name
+        row_idx += 1
 
-print("\n📊 RESOURCE INVENTORY:")
-print(df_resources.to_string(index=False))
+# Low-cardinality columns as categoricals with known categories (integer codes);
+# any extra subclass names are added so no row ends up with a missing code
+cols['type'] = pd.Categorical(cols['type'],
+                              categories=sorted(set(_RESOURCE_TYPE_NAMES).union(cols['type'])))
+cols['resource_group'] = pd.Categorical(cols['resource_group'],
+                                        categories=sorted(rg.name for rg in resource_groups))
 
-# Summary by type
-print("\n📈 SUMMARY BY RESOURCE TYPE:")
-summary_by_type = df_resources.groupby('type').agg({
-    'name': 'count',
-    'monthly_cost': 'sum'
-}).round(2)
-summary_by_type.columns = ['Count', 'Total_Monthly_Cost']
-print(summary_by_type)
+# Create DataFrame for analysis
+df_resources = pd.DataFrame(cols, copy=False)
+
+# Stream the inventory row by row from one template instead of rendering the
+# whole frame with to_string(); large inventories are cut off for display
+INVENTORY_COLUMNS = ['name', 'type', 'resource_group', 'location', 'status', 'created',
+                     'monthly_cost', 'tags']
+INVENTORY_ROW = "{0:<18} {1:<15} {2:<15} {3:<10} {4:<8} {5:<11} {6:>12} {7}"
+INVENTORY_DISPLAY_LIMIT = 50
+
+print("\n📊 RESOURCE INVENTORY:", file=_buf)
+_buf.write(INVENTORY_ROW.format(*INVENTORY_COLUMNS) + "\n")
+for row in df_resources[INVENTORY_COLUMNS].head(INVENTORY_DISPLAY_LIMIT).itertuples(index=False):
+    _buf.write(INVENTORY_ROW.format(*row[:6], f"{row[6]:.2f}", row[7]) + "\n")
+if len(df_resources) > INVENTORY_DISPLAY_LIMIT:
+    print(f"... and {len(df_resources) - INVENTORY_DISPLAY_LIMIT} more (see the CSV export)", file=_buf)
+
+def summarize_by(column, count_name):
+    """Count and total monthly cost per category, straight from the categorical codes"""
+    cat = df_resources[column].cat
+    labels_idx, inverse, counts = np.unique(cat.codes.to_numpy(), return_inverse=True, return_counts=True)
+    totals = np.bincount(inverse, weights=df_resources['monthly_cost'].to_numpy())
+    return pd.DataFrame({count_name: counts, 'Total_Monthly_Cost': totals},
+                        index=pd.Index(cat.categories[labels_idx], name=column))
+
+# Summary by type (also feeds both charts)
+print("\n📈 SUMMARY BY RESOURCE TYPE:", file=_buf)
+summary_by_type = summarize_by('type', 'Count')
+print(summary_by_type.to_string(float_format='%.2f'), file=_buf)
 
 # Summary by resource group
-print("\n📈 SUMMARY BY RESOURCE GROUP:")
-summary_by_rg = df_resources.groupby('resource_group').agg({
-    'name': 'count',
-    'monthly_cost': 'sum'
-}).round(2)
-summary_by_rg.columns = ['Resource_Count', 'Total_Monthly_Cost']
-print(summary_by_rg)
-
-# Export to CSV
-df_resources.to_csv('azure_resource_inventory.csv', index=False)
-print("\n✅ Resource inventory exported to 'azure_resource_inventory.csv'")
-
-# Create visualization
-import matplotlib.pyplot as plt
-
-fig, axes = plt.subplots(1, 2, figsize=(14, 6))
-
-# Plot 1: Cost by Resource Type
-summary_by_type.plot(kind='bar', y='Total_Monthly_Cost', ax=axes[0], 
-                     color='#0078D4', legend=False, edgecolor='black')
-axes[0].set_title('Monthly Cost by Resource Type', fontweight='bold', fontsize=12)
-axes[0].set_xlabel('Resource Type', fontsize=10)
-axes[0].set_ylabel('Monthly Cost ($)', fontsize=10)
-axes[0].tick_params(axis='x', rotation=45)
-axes[0].grid(axis='y', alpha=0.3)
-
-# Plot 2: Resource Distribution
-type_counts = df_resources['type'].value_counts()
-axes[1].pie(type_counts.values, labels=type_counts.index, autopct='%1.1f%%',
-           startangle=90, colors=plt.cm.Set3.colors)
-axes[1].set_title('Resource Distribution by Type', fontweight='bold', fontsize=12)
+print("\n📈 SUMMARY BY RESOURCE GROUP:", file=_buf)
+summary_by_rg = summarize_by('resource_group', 'Resource_Count')
+print(summary_by_rg.to_string(float_format='%.2f'), file=_buf)
 
-plt.tight_layout()
-plt.savefig('azure_oop_resource_analysis.png', dpi=300, bbox_inches='tight')
-plt.show()
+# Export to CSV through a 1 MiB write buffer
+with open('azure_resource_inventory.csv', 'w', buffering=1 << 20, newline='') as csv_file:
+    df_resources.to_csv(csv_file, index=False)
+print("\n✅ Resource inventory exported to 'azure_resource_inventory.csv'", file=_buf)
 
-print("✅ Visualization saved as 'azure_oop_resource_analysis.png'")
-
-print("\n" + "=" * 70)
-print("🎓 LAB 5 COMPLETE!")
-print("=" * 70)
-print("\nOOP Concepts Demonstrated:")
-print("  ✅ Classes and Objects")
-print("  ✅ Inheritance (Abstract base class → Concrete classes)")
-print("  ✅ Encapsulation (Private variables, properties)")
-print("  ✅ Polymorphism (calculate_cost() for different resource types)")
-print("  ✅ Composition (ResourceGroup contains Resources)")
-print("  ✅ Abstract methods (@abstractmethod)")
-print("  ✅ Special methods (__str__, __repr__, __len__, __iter__)")
-print("  ✅ Class vs Instance variables")
-print("  ✅ Method overriding")
-print("  ✅ Property decorators (@property)")
-print("\nReal-World Skills:")
-print("  ✅ Modular, reusable code design")
-print("  ✅ Clean code architecture")
-print("  ✅ Type hierarchies")
-print("  ✅ Resource management patterns")
-print("=" * 70)
\ No newline at end of file
+# Create visualization
+_FIG = globals().get('_FIG')  # Keep the figure from an earlier run (e.g. in a notebook)
+
+def render_charts(summary_by_type, path, dpi=300):
+    """Draw cost-by-type and distribution charts and save them to path (needs PLOT)"""
+    global _FIG
+    if _FIG is None:
+        _FIG, _ = plt.subplots(1, 2, figsize=(14, 6))
+    axes = _FIG.axes
+    for ax in axes:
+        ax.cla()
+    
+    # Plot 1: Cost by Resource Type
+    summary_by_type.plot(kind='bar', y='Total_Monthly_Cost', ax=axes[0], 
+                         color='#0078D4', legend=False, edgecolor='black')
+    axes[0].set_title('Monthly Cost by Resource Type', fontweight='bold', fontsize=12)
+    axes[0].set_xlabel('Resource Type', fontsize=10)
+    axes[0].set_ylabel('Monthly Cost ($)', fontsize=10)
+    axes[0].tick_params(axis='x', rotation=45)
+    axes[0].grid(axis='y', alpha=0.3)
+    
+    # Plot 2: Resource Distribution (counts from the same summary, no second scan)
+    axes[1].pie(summary_by_type['Count'].to_numpy(), labels=summary_by_type.index, autopct='%1.1f%%',
+               startangle=90, colors=plt.cm.Set3.colors)
+    axes[1].set_title('Resource Distribution by Type', fontweight='bold', fontsize=12)
+    
+    _FIG.tight_layout()
+    _FIG.savefig(path, dpi=dpi, bbox_inches='tight')
+
+if __name__ == "__main__" and PLOT:
+    render_charts(summary_by_type, 'azure_oop_resource_analysis.png')
+    print("✅ Visualization saved as 'azure_oop_resource_analysis.png'", file=_buf)
+else:
+    print("ℹ️  Charts skipped (set PLOT=1 to render them)", file=_buf)
+
+print("\n" + "=" * 70, file=_buf)
+print("🎓 LAB 5 COMPLETE!", file=_buf)
+print("=" * 70, file=_buf)
+print("\nOOP Concepts Demonstrated:", file=_buf)
+print("  ✅ Classes and Objects", file=_buf)
+print("  ✅ Inheritance (Abstract base class → Concrete classes)", file=_buf)
+print("  ✅ Encapsulation (Private variables, properties)", file=_buf)
+print("  ✅ Polymorphism (calculate_cost() for different resource types)", file=_buf)
+print("  ✅ Composition (ResourceGroup contains Resources)", file=_buf)
+print("  ✅ Abstract methods (@abstractmethod)", file=_buf)
+print("  ✅ Special methods (__str__, __repr__, __len__, __iter__)", file=_buf)
+print("  ✅ Class vs Instance variables", file=_buf)
+print("  ✅ __slots__ (fixed attribute layout, no per-instance __dict__)", file=_buf)
+print("  ✅ Method overriding", file=_buf)
+print("  ✅ Property decorators (@property)", file=_buf)
+print("\nReal-World Skills:", file=_buf)
+print("  ✅ Modular, reusable code design", file=_buf)
+print("  ✅ Clean code architecture", file=_buf)
+print("  ✅ Type hierarchies", file=_buf)
+print("  ✅ Resource management patterns", file=_buf)
+print("=" * 70, file=_buf)
+sys.stdout.write(_buf.getvalue())
\ No newline at end of file